@@ -3,7 +3,8 @@
 
 from __future__ import absolute_import
 
-import datetime
+import atexit
+import collections
 import json
 import logging
 import os
@@ -16,26 +17,47 @@ try:  # pragma: no cover - PySide optional when running tests
 except ImportError:  # pragma: no cover - tests/CLI
     QtCore = None
 
+try:  # pragma: no cover - optional C-accelerated JSON serialiser
+    import orjson  # pylint: disable=import-error
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
+try:  # pragma: no cover - Python 3.2+ only
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+except ImportError:  # pragma: no cover - Python 2.7 inside Nuke Studio 12
+    queue = None
+    QueueHandler = None
+    QueueListener = None
+
 try:  # pragma: no cover - Python 3 tooling support
     unicode
 except NameError:  # pragma: no cover
     unicode = str
 
+_TEXT_TYPES = (str, unicode)
+_SCALAR_TYPES = (str, unicode, bool, int, float)
+# Exact-type lookup for the common leaves; subclasses still go through isinstance.
+_EXACT_SCALAR_TYPES = frozenset(_SCALAR_TYPES + (type(None),))
+_CONFIGURED = False
+_LOG_PATH = None
 _LOG_STATE = {
-    'configured': False,
-    'log_path': None,
     'log_dir': None,
     'summary_dir': None,
     'previous_hook': None,
+    'log_listener': None,
     'qt_handler_installed': False,
-    'qt_message_cache': {},
+    'qt_message_cache': collections.OrderedDict(),
 }
 DEFAULT_LOG_DIRNAME = 'kitsu_loader_logs'
 DEFAULT_SUMMARY_DIRNAME = 'kitsu_loader_runs'
 _QT_REPEAT_LIMIT = 5
 _QT_SUPPRESS_INTERVAL = 25
 _QT_RESET_SECONDS = 5.0
+_QT_CACHE_LIMIT = 256
 _QT_DISABLE_ENV = 'KITSU_LOADER_DISABLE_QT_LOG'
+_SORT_SUMMARY_ENV = 'KITSU_LOADER_SORT_SUMMARY'
+_SUMMARY_WRITE_BUFFER = 1 << 20
 LOGGER = logging.getLogger(__name__)
 
 
@@ -45,11 +67,12 @@ def initialize(debug_name='kitsu_loader'):
     Returns:
         str: Path to the current log file (best-effort).
     """
-    if _LOG_STATE['configured']:
-        return _LOG_STATE['log_path']
+    global _CONFIGURED, _LOG_PATH  # pylint: disable=global-statement
+    if _CONFIGURED:
+        return _LOG_PATH
     log_dir = _ensure_directory(os.path.join(_user_home(), DEFAULT_LOG_DIRNAME))
     summary_dir = _ensure_directory(os.path.join(_user_home(), DEFAULT_SUMMARY_DIRNAME))
-    timestamp = datetime.datetime.now().strftime('%Y%m%d')
+    timestamp = time.strftime('%Y%m%d', time.localtime())
     log_path = os.path.join(log_dir, '%s_%s.log' % (debug_name, timestamp))
     handler = logging.FileHandler(log_path)
     formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
@@ -57,22 +80,22 @@ def initialize(debug_name='kitsu_loader'):
     root_logger = logging.getLogger()
     if not root_logger.handlers:
         root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_background_handler(handler))
+    _LOG_PATH = _intern_path(log_path)
+    _CONFIGURED = True
     _LOG_STATE.update({
-        'configured': True,
-        'log_path': log_path,
         'log_dir': log_dir,
         'summary_dir': summary_dir,
     })
     _install_exception_hook()
     _install_qt_message_handler()
-    LOGGER.info('Debug logging initialised: %s', log_path)
-    return log_path
+    LOGGER.info('Debug logging initialised: %s', _LOG_PATH)
+    return _LOG_PATH
 
 
 def current_log_file():
     """Return the active log file path, if configured."""
-    return _LOG_STATE.get('log_path')
+    return _LOG_PATH
 
 
 def record_exception(context_label, exc_info=None):
@@ -82,8 +105,11 @@ def record_exception(context_label, exc_info=None):
         exc_info = sys.exc_info()
     trace_text = None
     if exc_info and exc_info[0]:
+        # Format once and log the text; passing exc_info would make logging re-render the frames.
         trace_text = ''.join(traceback.format_exception(*exc_info))
-        LOGGER.error('Unhandled exception in %s', context_label, exc_info=exc_info)
+        LOGGER.error('Unhandled exception in %s\n%s', context_label, trace_text.rstrip())
+    # Drop the traceback reference so its frames (and their locals) can be collected.
+    exc_info = None
     payload = {
         'context': context_label,
         'log_file': current_log_file(),
@@ -98,12 +124,14 @@ def write_run_summary(summary, filename_prefix='loader_run'):
     summary_dir = _LOG_STATE.get('summary_dir')
     if not summary_dir:
         return None
-    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime())
     file_path = os.path.join(summary_dir, '%s_%s.json' % (filename_prefix, timestamp))
     safe_summary = _sanitize(summary)
     try:
-        with open(file_path, 'w') as handle:  # pylint: disable=unspecified-encoding
-            json.dump(safe_summary, handle, indent=2, sort_keys=True)
+        # Serialise up front so the file receives one buffered write instead of one per token.
+        data = _serialise_summary(safe_summary, _env_flag(_SORT_SUMMARY_ENV))
+        with open(file_path, 'wb', _SUMMARY_WRITE_BUFFER) as handle:
+            handle.write(data)
         LOGGER.info('Run summary written to %s', file_path)
         return file_path
     except Exception:  # pragma: no cover - disk permission issues
@@ -111,18 +139,68 @@ def write_run_summary(summary, filename_prefix='loader_run'):
         return None
 
 
+def _serialise_summary(payload, sort_keys):
+    """Return the indented JSON document for ``payload`` as UTF-8 bytes."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:  # e.g. integers wider than 64 bits; stdlib json copes
+            pass
+    return json.dumps(payload, indent=2, sort_keys=sort_keys).encode('utf-8')
+
+
 def _sanitize(payload):
-    if isinstance(payload, dict):
-        sanitized = {}
-        for key, value in payload.items():
-            if isinstance(key, (str, unicode)):
-                sanitized[key] = _sanitize(value)
-        return sanitized
-    if isinstance(payload, (list, tuple)):
-        return [_sanitize(item) for item in payload]
-    if isinstance(payload, (str, unicode, bool, int, float)) or payload is None:
-        return payload
-    return unicode(payload)
+    """Return a JSON-safe copy of ``payload`` using an explicit stack instead of recursion."""
+    root = [None]
+    stack = [(root, 0, payload)]
+    while stack:
+        parent, slot, node = stack.pop()
+        node_type = type(node)
+        if node_type in _EXACT_SCALAR_TYPES:
+            parent[slot] = node
+        elif node_type is dict or isinstance(node, dict):
+            sanitized = {}
+            parent[slot] = sanitized
+            for key, value in node.items():
+                if isinstance(key, _TEXT_TYPES):
+                    sanitized[key] = None  # reserve the slot so key order is preserved
+                    stack.append((sanitized, key, value))
+        elif node_type is list or node_type is tuple or isinstance(node, (list, tuple)):
+            sanitized = [None] * len(node)
+            parent[slot] = sanitized
+            stack.extend((sanitized, index, item) for index, item in enumerate(node))
+        elif isinstance(node, _SCALAR_TYPES):
+            parent[slot] = node
+        else:
+            parent[slot] = unicode(node)
+    return root[0]
+
+
+def _background_handler(file_handler):
+    """Route records through a queue so disk writes happen off the caller's thread.
+
+    ``QueueHandler.prepare`` still formats each record on the calling thread;
+    only the file IO moves to the listener thread.
+    """
+    if QueueListener is None:
+        return file_handler
+    record_queue = queue.Queue(-1)
+    listener = QueueListener(record_queue, file_handler)
+    listener.start()
+    _LOG_STATE['log_listener'] = listener
+    atexit.register(_stop_log_listener)
+    return QueueHandler(record_queue)
+
+
+def _stop_log_listener():
+    """Flush queued records to disk and stop the background writer."""
+    listener = _LOG_STATE.get('log_listener')
+    _LOG_STATE['log_listener'] = None
+    if listener is not None:
+        listener.stop()
 
 
 def _install_exception_hook():
@@ -145,27 +223,35 @@ def _install_exception_hook():
 def _install_qt_message_handler():  # pragma: no cover - only in host with Qt
     if QtCore is None or _LOG_STATE.get('qt_handler_installed'):
         return
-    disable_flag = os.environ.get(_QT_DISABLE_ENV, '').strip().lower()
-    if disable_flag in ('1', 'true', 'yes', 'on'):
+    if _env_flag(_QT_DISABLE_ENV):
         LOGGER.warning('Qt message handler disabled via %s', _QT_DISABLE_ENV)
         return
 
     def _qt_handler(msg_type, context, message):
         try:
             level = _qt_level_from_msg(msg_type)
-            cache = _LOG_STATE.setdefault('qt_message_cache', {})
+            if not LOGGER.isEnabledFor(level):
+                return
+            cache = _LOG_STATE['qt_message_cache']
             key = unicode(message)
             now = time.time()
-            entry = cache.get(key)
+            entry = cache.pop(key, None)
             if entry and (now - entry.get('last_time', 0)) > _QT_RESET_SECONDS:
                 entry = None
             if entry is None:
-                entry = {'count': 0, 'suppressed': 0}
+                # A given message comes from one call site, so its context is captured once.
+                entry = {
+                    'count': 0,
+                    'suppressed': 0,
+                    'context': (
+                        getattr(context, 'line', '?'),
+                        getattr(context, 'function', '?'),
+                        getattr(context, 'file', '?'),
+                    ),
+                }
             entry['count'] += 1
             entry['last_time'] = now
-            line = getattr(context, 'line', '?')
-            func = getattr(context, 'function', '?')
-            file_name = getattr(context, 'file', '?')
+            line, func, file_name = entry['context']
             if entry['count'] <= _QT_REPEAT_LIMIT:
                 LOGGER.log(level, 'Qt: %s (line=%s function=%s file=%s)', message, line, func, file_name)
             else:
@@ -181,7 +267,10 @@ def _install_qt_message_handler():  # pragma: no cover - only in host with Qt
                         func,
                         file_name,
                     )
+            # Re-inserting moves the key to the newest end; the oldest messages fall off.
             cache[key] = entry
+            while len(cache) > _QT_CACHE_LIMIT:
+                cache.popitem(last=False)
         except Exception:
             LOGGER.exception('Qt message handler failed')
 
@@ -207,6 +296,10 @@ def _qt_level_from_msg(msg_type):
     return mapping.get(numeric, logging.INFO)
 
 
+def _env_flag(name):
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 def _ensure_directory(path_value):
     if not path_value:
         return path_value
@@ -218,5 +311,13 @@ def _ensure_directory(path_value):
     return path_value
 
 
+def _intern_path(path_value):
+    # sys.intern is Python 3 only; Python 2's builtin intern() rejects unicode paths.
+    intern_text = getattr(sys, 'intern', None)
+    if intern_text is None or not isinstance(path_value, str):
+        return path_value
+    return intern_text(path_value)
+
+
 def _user_home():
     return os.path.expanduser('~')
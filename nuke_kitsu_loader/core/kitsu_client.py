@@ -3,9 +3,19 @@
 
 from __future__ import absolute_import
 
+import collections
+import hashlib
 import json
 import logging
 import os
+import re
+import threading
+import time
+
+try:  # pragma: no cover - optional C-accelerated JSON parser
+    import orjson  # pylint: disable=import-error
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 try:
     import gazu  # pylint: disable=import-error
@@ -18,6 +28,32 @@ from nuke_kitsu_loader.core import utils
 LOGGER = logging.getLogger(__name__)
 
 _CONFIG = None
+_CONFIG_MTIME = None
+_CONFIG_MISSING = object()  # _CONFIG_MTIME marker: the file was absent at the last load
+_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'configs', 'plugin_config.json')
+_PATH_MAPPINGS = {
+    'source': None,
+    'pattern': None,
+    'replacements': {},
+}
+_MAX_FETCH_WORKERS = 8
+_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+_SHOT_CACHE_LIMIT = 256
+_SHOT_CACHE_TTL_SECONDS = 60.0
+_SHOT_TASKS_CACHE = collections.OrderedDict()
+_SHOT_CACHE_LOCK = threading.Lock()
+_NORMALIZED_TASK_KEY = '_kitsu_loader_normalized_name'
+_TASK_NAME_TRANSLATION = {ord(' '): ord('_'), ord('-'): ord('_')}
+_CA_BUNDLE_HOST = None
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), 'kitsu_loader_cache')
+_DISK_CACHE_LOCK = threading.Lock()
+_DISK_CACHE_REFRESHES = {}
+_GAZU_API = {
+    'module': None,
+    'fetch_sequences': None,
+    'fetch_comments': None,
+}
 _SESSION = {
     'host': None,
     'user': None,
@@ -31,23 +67,64 @@ except NameError:  # pragma: no cover
 
 
 def _load_config():
-    """Lazy-load plugin configuration."""
-    global _CONFIG  # pylint: disable=global-statement
-    if _CONFIG is not None:
+    """Lazy-load plugin configuration, re-reading it when the file changes on disk."""
+    global _CONFIG, _CONFIG_MTIME  # pylint: disable=global-statement
+    if _CONFIG is not None and _CONFIG_MTIME is None:
+        return _CONFIG  # assigned directly rather than read from disk
+    mtime = _config_mtime()
+    if mtime is None:
+        # Keep stat-ing a missing file so a config created later is picked up.
+        if _CONFIG is None or _CONFIG_MTIME is not _CONFIG_MISSING:
+            _CONFIG = {}
+            _CONFIG_MTIME = _CONFIG_MISSING
         return _CONFIG
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'configs', 'plugin_config.json')
-    if not os.path.exists(config_path):
-        _CONFIG = {}
+    if _CONFIG is not None and mtime == _CONFIG_MTIME:
         return _CONFIG
     try:
-        with open(config_path, 'r') as handle:
-            _CONFIG = json.load(handle)
+        _CONFIG = _read_json(_CONFIG_PATH)
     except Exception as exc:  # pragma: no cover - config parsing errors
-        LOGGER.error('Failed to load config %s: %s', config_path, exc)
+        LOGGER.error('Failed to load config %s: %s', _CONFIG_PATH, exc)
         _CONFIG = {}
+    _CONFIG_MTIME = mtime
     return _CONFIG
 
 
+def _read_json(path_value):
+    if orjson is not None:
+        with open(path_value, 'rb') as handle:
+            return orjson.loads(handle.read())
+    with open(path_value, 'r') as handle:
+        return json.load(handle)
+
+
+def _config_mtime():
+    try:
+        return os.stat(_CONFIG_PATH).st_mtime
+    except OSError:
+        return None
+
+
+def _path_mappings():
+    """Return ``(prefix_pattern, replacements)`` for the active config, built once per load."""
+    config = _load_config()
+    if _PATH_MAPPINGS['source'] is not config:
+        replacements = {}
+        for mapping in config.get('path_mappings', []):
+            match_value = mapping.get('match')
+            replace_value = mapping.get('replace')
+            if match_value and replace_value and match_value not in replacements:
+                replacements[match_value] = replace_value
+        pattern = None
+        if replacements:
+            # Longest prefixes first so the alternation yields the most specific mapping.
+            prefixes = sorted(replacements, key=len, reverse=True)
+            pattern = re.compile('|'.join(re.escape(prefix) for prefix in prefixes))
+        _PATH_MAPPINGS['pattern'] = pattern
+        _PATH_MAPPINGS['replacements'] = replacements
+        _PATH_MAPPINGS['source'] = config
+    return _PATH_MAPPINGS['pattern'], _PATH_MAPPINGS['replacements']
+
+
 def _gazu_available():
     if gazu is None:
         return False, 'gazu module is not available. Install or vendor it before continuing.'
@@ -60,15 +137,25 @@ def _ensure_session():
     return True, None
 
 
+def _bootstrap(host=None):
+    """Resolve the target host and prepare TLS settings for it once per host."""
+    global _CA_BUNDLE_HOST  # pylint: disable=global-statement
+    host = host or get_default_host()
+    if host and host != _CA_BUNDLE_HOST:
+        # Only remember hosts that actually got a bundle so failures are retried.
+        if configure_kitsu_ca_bundle(host):
+            _CA_BUNDLE_HOST = host
+    return host
+
+
 def login(host, username, password):
     """Authenticate against the configured Kitsu instance."""
     ok, error = _gazu_available()
     if not ok:
         return False, error
-    host = host or get_default_host()
+    host = _bootstrap(host)
     if not host:
         return False, 'Kitsu host is not configured. Update configs/plugin_config.json.'
-    configure_kitsu_ca_bundle(host)
     try:
         gazu.set_host(host)
         user = gazu.log_in(username, password)
@@ -90,6 +177,7 @@ def logout():
     except Exception as exc:  # pragma: no cover
         LOGGER.warning('Error during logout: %s', exc)
     finally:
+        invalidate_shot_cache()
         _SESSION['host'] = None
         _SESSION['user'] = None
         _SESSION['logged_in'] = False
@@ -100,20 +188,7 @@ def get_projects():
     ok, error = _ensure_session()
     if not ok:
         return False, error
-    try:
-        projects = gazu.project.all_projects()
-    except Exception as exc:  # pragma: no cover - depends on API
-        LOGGER.exception('Failed to fetch projects: %s', exc)
-        return False, str(exc)
-    payload = [
-        {
-            'id': project.get('id'),
-            'name': project.get('name'),
-            'data': project,
-        }
-        for project in projects
-    ]
-    return True, payload
+    return _cached_listing(('projects',), _fetch_projects, 'projects', serve_stale=True)
 
 
 def get_sequences(project_id):
@@ -121,30 +196,12 @@ def get_sequences(project_id):
     ok, error = _ensure_session()
     if not ok:
         return False, error
-    try:
-        project = gazu.project.get_project(project_id)
-        shot_module = getattr(gazu, 'shot', None)
-        if shot_module is None:
-            raise AttributeError('gazu.shot module unavailable')
-        fetch_sequences = getattr(shot_module, 'all_sequences_for_project', None)
-        if fetch_sequences is None:
-            # legacy fallback for older releases
-            fetch_sequences = getattr(shot_module, 'all_sequences', None)
-        if fetch_sequences is None:
-            raise AttributeError('Gazu API does not expose all_sequences_for_project/all_sequences')
-        sequences = fetch_sequences(project)
-    except Exception as exc:  # pragma: no cover
-        LOGGER.exception('Failed to fetch sequences for %s: %s', project_id, exc)
-        return False, str(exc)
-    payload = [
-        {
-            'id': sequence.get('id'),
-            'name': sequence.get('name'),
-            'data': sequence,
-        }
-        for sequence in sequences
-    ]
-    return True, payload
+    return _cached_listing(
+        ('sequences', project_id),
+        lambda: _fetch_sequences(project_id),
+        'sequences for %s' % project_id,
+        serve_stale=True,
+    )
 
 
 def get_tasks_for_sequence(sequence_id):
@@ -175,22 +232,13 @@ def get_shots_for_sequence(sequence_id):
     ok, error = _ensure_session()
     if not ok:
         return False, error
-    try:
-        sequence = gazu.shot.get_sequence(sequence_id)
-        shots = gazu.shot.all_shots_for_sequence(sequence)
-    except Exception as exc:  # pragma: no cover
-        LOGGER.exception('Failed to fetch shots for %s: %s', sequence_id, exc)
-        return False, str(exc)
-    shots = sorted(shots, key=lambda shot: shot.get('name') or shot.get('code') or '')
-    payload = [
-        {
-            'id': shot.get('id'),
-            'name': shot.get('name') or shot.get('code'),
-            'data': shot,
-        }
-        for shot in shots
-    ]
-    return True, payload
+    # Shots drive what the loader imports, so the disk copy is only an offline fallback.
+    return _cached_listing(
+        ('shots', sequence_id),
+        lambda: _fetch_shots(sequence_id),
+        'shots for %s' % sequence_id,
+        serve_stale=False,
+    )
 
 
 def get_latest_conform_comment(shot_id):
@@ -199,30 +247,23 @@ def get_latest_conform_comment(shot_id):
     if not ok:
         return False, error
     try:
-        shot = gazu.shot.get_shot(shot_id)
-        tasks = gazu.task.all_tasks_for_shot(shot)
+        tasks = _tasks_for_shot(shot_id)
     except Exception as exc:  # pragma: no cover
         LOGGER.exception('Failed to fetch tasks for shot %s: %s', shot_id, exc)
         return False, str(exc)
     conform_tasks = [
         task for task in tasks
-        if _normalize_task_name(_task_type_name(task)).startswith('conform')
+        if _normalized_task_type_name(task).startswith('conform')
     ]
     if not conform_tasks:
         return True, None
     comments = []
-    for task in conform_tasks:
-        comments.extend(_fetch_task_comments(task))
+    for task_comments in _map_concurrently(_fetch_task_comments, conform_tasks):
+        comments.extend(task_comments)
     if not comments:
         return True, None
-    comments = sorted(comments, key=_comment_sort_key)
-    for comment in reversed(comments):
-        text = _comment_text(comment)
-        if not text:
-            continue
-        if utils.extract_location_from_comment(text):
-            return True, text
-    return True, None
+    text, _ = _newest_comment_match(comments, utils.extract_location_from_comment)
+    return True, text
 
 
 def get_latest_workfile_for_shot(shot_id, task_name):
@@ -233,18 +274,16 @@ def get_latest_workfile_for_shot(shot_id, task_name):
     if not task_name:
         return True, None
     try:
-        shot = gazu.shot.get_shot(shot_id)
-        tasks = gazu.task.all_tasks_for_shot(shot)
+        tasks = _tasks_for_shot(shot_id)
     except Exception as exc:  # pragma: no cover
         LOGGER.exception('Failed to fetch tasks for shot %s: %s', shot_id, exc)
         return False, str(exc)
     desired = _normalize_task_name(task_name)
     task_candidates = [
         task for task in tasks
-        if _normalize_task_name(_task_type_name(task)) == desired
+        if _normalized_task_type_name(task) == desired
     ]
-    for task in task_candidates:
-        workfile_path = _latest_workfile_from_comments(task)
+    for workfile_path in _map_concurrently(_latest_workfile_from_comments, task_candidates):
         if workfile_path:
             return True, translate_repo_path_to_unc(workfile_path)
     for task in task_candidates:
@@ -262,54 +301,184 @@ def get_latest_render_for_shot(shot_id, task_name):
     if not task_name:
         return True, None
     try:
-        shot = gazu.shot.get_shot(shot_id)
-        tasks = gazu.task.all_tasks_for_shot(shot)
+        tasks = _tasks_for_shot(shot_id)
     except Exception as exc:  # pragma: no cover
         LOGGER.exception('Failed to fetch tasks for shot %s: %s', shot_id, exc)
         return False, str(exc)
     desired = _normalize_task_name(task_name)
     task_candidates = [
         task for task in tasks
-        if _normalize_task_name(_task_type_name(task)) == desired
+        if _normalized_task_type_name(task) == desired
     ]
     # Get latest comment with location field
-    for task in task_candidates:
-        render_path = _latest_render_from_comments(task)
+    for render_path in _map_concurrently(_latest_render_from_comments, task_candidates):
         if render_path:
             return True, translate_repo_path_to_unc(render_path)
     return True, None
 
 
+def invalidate_shot_cache(shot_id=None):
+    """Forget cached task lists for ``shot_id``, or for every shot when omitted."""
+    with _SHOT_CACHE_LOCK:
+        if shot_id is None:
+            _SHOT_TASKS_CACHE.clear()
+        else:
+            _SHOT_TASKS_CACHE.pop(shot_id, None)
+
+
 def translate_repo_path_to_unc(path_value):
     """Translate a repository path into a UNC path based on config mappings."""
     if not path_value:
         return path_value
-    config = _load_config()
-    mappings = config.get('path_mappings', [])
-    for mapping in mappings:
-        match_value = mapping.get('match')
-        replace_value = mapping.get('replace')
-        if not match_value or not replace_value:
-            continue
-        if path_value.startswith(match_value):
-            path_value = path_value.replace(match_value, replace_value, 1)
+    pattern, replacements = _path_mappings()
+    match = pattern.match(path_value) if pattern is not None else None
+    if match:
+        path_value = replacements[match.group(0)] + path_value[match.end():]
     # Normalize to forward slashes
     return path_value.replace('\\', '/')
 
 
+def _tasks_for_shot(shot_id):
+    """Return the shot's tasks, reusing a recent fetch for the same shot."""
+    now = time.time()
+    with _SHOT_CACHE_LOCK:
+        cached = _SHOT_TASKS_CACHE.get(shot_id)
+    if cached is not None and now - cached[0] <= _SHOT_CACHE_TTL_SECONDS:
+        return cached[1]
+    shot = gazu.shot.get_shot(shot_id)
+    tasks = gazu.task.all_tasks_for_shot(shot)
+    with _SHOT_CACHE_LOCK:
+        _SHOT_TASKS_CACHE.pop(shot_id, None)
+        _SHOT_TASKS_CACHE[shot_id] = (now, tasks)
+        while len(_SHOT_TASKS_CACHE) > _SHOT_CACHE_LIMIT:
+            _SHOT_TASKS_CACHE.popitem(last=False)
+    return tasks
+
+
+def _fetch_projects():
+    projects = gazu.project.all_projects()
+    return [
+        {
+            'id': project.get('id'),
+            'name': project.get('name'),
+            'data': project,
+        }
+        for project in projects
+    ]
+
+
+def _fetch_sequences(project_id):
+    project = gazu.project.get_project(project_id)
+    fetch_sequences = _gazu_api()['fetch_sequences']
+    if fetch_sequences is None:
+        raise AttributeError('Gazu API does not expose all_sequences_for_project/all_sequences')
+    sequences = fetch_sequences(project)
+    return [
+        {
+            'id': sequence.get('id'),
+            'name': sequence.get('name'),
+            'data': sequence,
+        }
+        for sequence in sequences
+    ]
+
+
+def _fetch_shots(sequence_id):
+    sequence = gazu.shot.get_sequence(sequence_id)
+    shots = gazu.shot.all_shots_for_sequence(sequence)
+    named_shots = [(shot.get('name') or shot.get('code'), shot) for shot in shots]
+    named_shots.sort(key=_shot_name_sort_key)
+    return [
+        {
+            'id': shot.get('id'),
+            'name': name,
+            'data': shot,
+        }
+        for name, shot in named_shots
+    ]
+
+
+def _cached_listing(key_parts, fetch, description, serve_stale):
+    """Return ``fetch()`` backed by the on-disk listing cache.
+
+    With ``serve_stale`` a cached copy is returned immediately and refreshed in
+    the background; otherwise the cache is only used when Kitsu is unreachable.
+    """
+    if not _load_config().get('cache_listings', True):
+        cache_key, cached = None, None
+    else:
+        cache_key = _disk_cache_key(key_parts)
+        cached = _disk_cache_get(cache_key)
+    if cached is not None and serve_stale:
+        _refresh_disk_cache_async(cache_key, fetch, description)
+        return True, cached
+    try:
+        payload = fetch()
+    except Exception as exc:  # pragma: no cover - depends on API
+        if cached is not None:
+            LOGGER.warning('Failed to fetch %s, using cached copy: %s', description, exc)
+            return True, cached
+        LOGGER.exception('Failed to fetch %s: %s', description, exc)
+        return False, str(exc)
+    if cache_key is not None:
+        _disk_cache_put(cache_key, payload)
+    return True, payload
+
+
+def _disk_cache_key(key_parts):
+    user = _SESSION.get('user') or {}
+    raw = json.dumps([_SESSION.get('host'), user.get('id')] + list(key_parts))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _disk_cache_get(cache_key):
+    cache_path = os.path.join(_DISK_CACHE_DIR, cache_key + '.json')
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        return _read_json(cache_path).get('payload')
+    except Exception as exc:  # pragma: no cover - corrupt or partially written file
+        LOGGER.warning('Ignoring unreadable cache file %s: %s', cache_path, exc)
+        return None
+
+
+def _disk_cache_put(cache_key, payload):
+    cache_path = os.path.join(_DISK_CACHE_DIR, cache_key + '.json')
+    try:
+        if not os.path.isdir(_DISK_CACHE_DIR):
+            os.makedirs(_DISK_CACHE_DIR)
+        with open(cache_path, 'w') as handle:
+            json.dump({'saved_at': time.time(), 'payload': payload}, handle)
+    except Exception as exc:  # pragma: no cover - disk permission issues
+        LOGGER.warning('Failed to write cache file %s: %s', cache_path, exc)
+
+
+def _refresh_disk_cache_async(cache_key, fetch, description):
+    """Re-fetch a listing on a daemon thread and store it for the next call."""
+    with _DISK_CACHE_LOCK:
+        if cache_key in _DISK_CACHE_REFRESHES:
+            return
+
+        def _refresh():
+            try:
+                _disk_cache_put(cache_key, fetch())
+            except Exception as exc:  # pragma: no cover - depends on API
+                LOGGER.warning('Background refresh of %s failed: %s', description, exc)
+            finally:
+                with _DISK_CACHE_LOCK:
+                    _DISK_CACHE_REFRESHES.pop(cache_key, None)
+
+        worker = threading.Thread(target=_refresh, name='kitsu-cache-refresh')
+        worker.daemon = True
+        _DISK_CACHE_REFRESHES[cache_key] = worker
+        worker.start()
+
+
 def _latest_workfile_from_comments(task):
     comments = _fetch_task_comments(task)
     if not comments:
         return None
-    comments = sorted(comments, key=_comment_sort_key)
-    for comment in reversed(comments):
-        text = _comment_text(comment)
-        if not text:
-            continue
-        workfile = utils.extract_workfile_from_comment(text)
-        if workfile:
-            return workfile
-    return None
+    return _newest_comment_match(comments, utils.extract_workfile_from_comment)[1]
 
 
 def _latest_render_from_comments(task):
@@ -317,15 +486,7 @@ def _latest_render_from_comments(task):
     comments = _fetch_task_comments(task)
     if not comments:
         return None
-    comments = sorted(comments, key=_comment_sort_key)
-    for comment in reversed(comments):
-        text = _comment_text(comment)
-        if not text:
-            continue
-        render_location = utils.extract_location_from_comment(text)
-        if render_location:
-            return render_location
-    return None
+    return _newest_comment_match(comments, utils.extract_location_from_comment)[1]
 
 
 def _latest_workfile_from_task(task):
@@ -349,13 +510,48 @@ def _latest_workfile_from_task(task):
     return latest.get('file_path') or latest.get('path') or latest.get('full_path')
 
 
+def _fetch_executor():
+    """Return the shared Kitsu fetch pool, or ``None`` where thread pools are unavailable."""
+    global _EXECUTOR  # pylint: disable=global-statement
+    if _EXECUTOR is None:
+        # Loader pool threads can get here together; only one may create the pool.
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = utils.create_thread_pool(_MAX_FETCH_WORKERS)
+    return _EXECUTOR
+
+
+def _map_concurrently(func, items):
+    """Apply ``func`` to every item, fanning the calls out over a thread pool when possible.
+
+    Results are returned in input order. Gazu calls are blocking HTTP requests, so
+    running them side by side overlaps the network round-trips.
+    """
+    items = list(items)
+    executor = _fetch_executor() if len(items) > 1 else None
+    return [result for _, result in utils.iter_concurrently(executor, func, items)]
+
+
+def _gazu_api():
+    """Return version-dependent gazu callables, resolved once per gazu module."""
+    if _GAZU_API['module'] is not gazu:
+        shot_module = getattr(gazu, 'shot', None)
+        task_module = getattr(gazu, 'task', None)
+        # all_sequences/get_task_comments are legacy fallbacks for older releases
+        _GAZU_API['fetch_sequences'] = (
+            getattr(shot_module, 'all_sequences_for_project', None)
+            or getattr(shot_module, 'all_sequences', None)
+        )
+        _GAZU_API['fetch_comments'] = (
+            getattr(task_module, 'all_comments_for_task', None)
+            or getattr(task_module, 'get_task_comments', None)
+        )
+        _GAZU_API['module'] = gazu
+    return _GAZU_API
+
+
 def _fetch_task_comments(task):
-    task_module = getattr(gazu, 'task', None)
-    if task_module is None:
-        return []
-    fetcher = getattr(task_module, 'all_comments_for_task', None)
-    if fetcher is None:
-        fetcher = getattr(task_module, 'get_task_comments', None)
+    fetcher = _gazu_api()['fetch_comments']
     if fetcher is None:
         return []
     try:
@@ -366,10 +562,37 @@ def _fetch_task_comments(task):
     return comments or []
 
 
+def _newest_comment_match(comments, extract):
+    """Return ``(text, value)`` for the newest comment whose text ``extract`` accepts.
+
+    Runs in a single pass: comments older than the current best are skipped
+    before their text is parsed. Ties go to the later comment, as the former
+    stable sort did.
+    """
+    best_key = None
+    best = (None, None)
+    for comment in comments:
+        sort_key = _comment_sort_key(comment)
+        if best_key is not None and sort_key < best_key:
+            continue
+        text = _comment_text(comment)
+        if not text:
+            continue
+        value = extract(text)
+        if value:
+            best_key = sort_key
+            best = (text, value)
+    return best
+
+
 def _comment_sort_key(comment):
     return comment.get('created_at') or comment.get('updated_at') or ''
 
 
+def _shot_name_sort_key(named_shot):
+    return named_shot[0] or ''
+
+
 def _comment_text(comment):
     return comment.get('text') or comment.get('description') or comment.get('content') or ''
 
@@ -379,12 +602,19 @@ def _task_type_name(task):
     return task_type.get('name') or task.get('task_type_name') or ''
 
 
+def _normalized_task_type_name(task):
+    """Return the task's normalized type name, memoized on the task dict."""
+    normalized = task.get(_NORMALIZED_TASK_KEY)
+    if normalized is None:
+        normalized = _normalize_task_name(_task_type_name(task))
+        task[_NORMALIZED_TASK_KEY] = normalized
+    return normalized
+
+
 def _normalize_task_name(name):
     if not name:
         return ''
-    normalized = text_type(name).strip().lower()
-    normalized = normalized.replace(' ', '_').replace('-', '_')
-    return normalized
+    return text_type(name).strip().lower().translate(_TASK_NAME_TRANSLATION)
 
 
 def get_default_host():
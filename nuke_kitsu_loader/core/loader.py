@@ -3,8 +3,11 @@
 
 from __future__ import absolute_import
 
+import copy
 import logging
 import os
+import threading
+from contextlib import closing
 
 from PySide2 import QtCore  # pylint: disable=import-error
 
@@ -23,52 +26,84 @@ except NameError:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+_MAX_KITSU_WORKERS = 8
+_MESSAGE_FLUSH_INTERVAL_MS = 50
+_MESSAGE_BATCH_SIZE = 10
+
+
+class _MainThreadCall(object):
+    """A single main thread invocation and its outcome."""
+
+    __slots__ = ('callable_obj', 'args', 'result', 'exception')
+
+    def __init__(self, callable_obj, args_tuple):
+        self.callable_obj = callable_obj
+        self.args = args_tuple
+        self.result = None
+        self.exception = None
+
+    def run(self):
+        try:
+            self.result = self.callable_obj(*self.args)
+        except Exception as exc:
+            self.exception = exc
+
+    def outcome(self):
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+def _run_batch(calls):
+    """Run ``(callable, args_tuple)`` pairs in order; the first exception aborts the rest."""
+    return [callable_obj(*args_tuple) for callable_obj, args_tuple in calls]
+
 
 class MainThreadExecutor(QtCore.QObject):
-    """Helper to execute Hiero operations on the main thread from worker threads."""
+    """Helper to execute Hiero operations on the main thread from worker threads.
+
+    Requests use a blocking queued connection: Qt parks the emitting worker
+    until the slot has run on the executor's thread, so no Python-side lock
+    or wait is needed. Each request carries its own result slot.
+    """
 
-    execute_requested = QtCore.Signal(object, object)  # callable, args_tuple
+    execute_requested = QtCore.Signal(object)  # _MainThreadCall
     execution_complete = QtCore.Signal()
 
     def __init__(self):
         super(MainThreadExecutor, self).__init__()
-        self._result = None
-        self._exception = None
-        self._mutex = QtCore.QMutex()
-        self._wait_condition = QtCore.QWaitCondition()
-        self.execute_requested.connect(self._do_execute)
-
-    @QtCore.Slot(object, object)
-    def _do_execute(self, callable_obj, args_tuple):
-        """Execute any callable on main thread with args."""
-        self._mutex.lock()
-        try:
-            self._result = callable_obj(*args_tuple)
-            self._exception = None
-        except Exception as exc:
-            self._exception = exc
-            self._result = None
-        finally:
-            self._wait_condition.wakeAll()
-            self._mutex.unlock()
+        self.execute_requested.connect(self._do_execute, QtCore.Qt.BlockingQueuedConnection)
+
+    @QtCore.Slot(object)
+    def _do_execute(self, call):
+        """Execute a queued call on main thread."""
+        call.run()
 
     def execute_on_main_thread(self, callable_obj, args_tuple):
         """Execute callable on main thread and wait for result."""
-        self._mutex.lock()
-        try:
-            self._result = None
-            self._exception = None
-            self.execute_requested.emit(callable_obj, args_tuple)
-            self._wait_condition.wait(self._mutex)
-            result = self._result
-            exception = self._exception
-            self._result = None
-            self._exception = None
-            if exception:
-                raise exception
-            return result
-        finally:
-            self._mutex.unlock()
+        call = _MainThreadCall(callable_obj, args_tuple)
+        if QtCore.QThread.currentThread() is self.thread():
+            # A blocking queued emit from the receiver's own thread deadlocks.
+            call.run()
+        else:
+            self.execute_requested.emit(call)
+        return call.outcome()
+
+    def execute_batch_on_main_thread(self, calls):
+        """Execute ``(callable, args_tuple)`` pairs in one main thread round trip.
+
+        Returns the list of results in call order; the first exception raised
+        aborts the remaining calls and is re-raised here.
+        """
+        calls = [(call[0], tuple(call[1])) for call in calls]
+        return self.execute_on_main_thread(_run_batch, (calls,))
+
+
+def _add_video_track(sequence_obj, track_name):
+    """Create a video track and append it to ``sequence_obj`` (main thread only)."""
+    track = hiero.core.VideoTrack(track_name)
+    sequence_obj.addTrack(track)
+    return track
 
 
 class LoaderThread(QtCore.QThread):
@@ -78,6 +113,7 @@ class LoaderThread(QtCore.QThread):
     message = QtCore.Signal(unicode)  # pylint: disable=undefined-variable
     completed = QtCore.Signal(dict)
     errored = QtCore.Signal(dict)
+    summary_written = QtCore.Signal(unicode)  # pylint: disable=undefined-variable
 
     def __init__(self, sequences, project_name=None, main_thread_executor=None, parent=None):
         super(LoaderThread, self).__init__(parent)
@@ -87,7 +123,16 @@ class LoaderThread(QtCore.QThread):
         self._total_shots = 0
         self._processed_shots = 0
         self._project = None
+        self._root_bin = None
+        self._bin_cache = {}
+        self._path_exists_cache = {}
+        self._path_norm_cache = {}
+        self._pending_messages = []
+        self._message_timer = QtCore.QElapsedTimer()
+        self._pending_progress = None
+        self._last_progress = None
         self._main_thread_executor = main_thread_executor
+        self._kitsu_pool = None
 
     def cancel(self):
         """Allow the UI to request cancelation."""
@@ -99,6 +144,30 @@ class LoaderThread(QtCore.QThread):
             raise RuntimeError('MainThreadExecutor not provided to LoaderThread')
         return self._main_thread_executor.execute_on_main_thread(callable_obj, args)
 
+    def _invoke_batch_on_main_thread(self, calls):
+        """Execute ``(callable, args)`` pairs on the main thread in a single hop."""
+        if self._main_thread_executor is None:
+            raise RuntimeError('MainThreadExecutor not provided to LoaderThread')
+        return self._main_thread_executor.execute_batch_on_main_thread(calls)
+
+    def _iter_kitsu(self, func, items):
+        """Yield ``(item, func(item))`` for blocking Kitsu lookups run side by side, in input order.
+
+        Close the generator when stopping early so queued lookups are cancelled.
+        """
+        # Show what is queued before the caller blocks on Kitsu
+        self._flush_messages()
+        items = list(items)
+        if len(items) > 1 and self._kitsu_pool is None:
+            self._kitsu_pool = utils.create_thread_pool(_MAX_KITSU_WORKERS)
+        return utils.iter_concurrently(self._kitsu_pool, func, items)
+
+    def _shutdown_kitsu_pool(self):
+        # Consumers cancel their queued lookups, so at most the in-flight ones remain
+        if self._kitsu_pool is not None:
+            self._kitsu_pool.shutdown(wait=False)
+            self._kitsu_pool = None
+
     def run(self):
         """Process all selected sequences, building footage tracks."""
         summary = {
@@ -114,17 +183,34 @@ class LoaderThread(QtCore.QThread):
             summary['errors'].append(self._emit_error('UNHANDLED_EXCEPTION', message))
             summary['crash'] = crash_details
         finally:
+            self._shutdown_kitsu_pool()
             summary['processed_shots'] = self._processed_shots
             summary['log_file'] = debug.current_log_file()
-            summary_path = debug.write_run_summary(summary)
-            if summary_path:
-                summary['summary_file'] = summary_path
-                self.message.emit('Run summary saved to %s' % summary_path)
+            self._flush_messages()
             self.completed.emit(summary)
+            # Started after ``completed`` so summary_written is always delivered second
+            self._write_summary_async(summary)
+
+    def _write_summary_async(self, summary):
+        """Persist the run summary on a daemon thread so ``completed`` is not held up by disk IO.
+
+        ``summary_written`` always fires once the write is over, carrying the file
+        path or an empty string if nothing could be written. Receivers should keep
+        the thread alive until then.
+        """
+        snapshot = copy.deepcopy(summary)
+
+        def write_and_notify():
+            summary_path = debug.write_run_summary(snapshot)
+            self.summary_written.emit(summary_path or '')
+
+        writer = threading.Thread(target=write_and_notify, name='kitsu-loader-summary')
+        writer.daemon = True
+        writer.start()
 
     def _process_sequences(self, summary):
         if not self._sequences:
-            self.message.emit('No sequences selected for loading')
+            self._queue_message('No sequences selected for loading')
             return
         plans, prep_errors = self._prepare_sequence_plans()
         summary['errors'].extend(prep_errors)
@@ -139,7 +225,7 @@ class LoaderThread(QtCore.QThread):
         
         for plan in plans:
             if self._cancel:
-                self.message.emit('Loader canceled before finishing all sequences')
+                self._queue_message('Loader canceled before finishing all sequences')
                 break
             sequence_summary = self._process_sequence_plan_for_combined_timeline(plan, all_shot_entries, all_task_names, all_errors)
             summary['sequences'].append(sequence_summary)
@@ -152,9 +238,39 @@ class LoaderThread(QtCore.QThread):
             if not ok:
                 all_errors.append(self._emit_error('HIERO_ERROR', unicode(payload), sequence_name=self._project_name))
             else:
-                self.message.emit('Created timeline %s with %d clips from %d sequences' % (self._project_name, len(all_shot_entries), len(plans)))
+                self._queue_message('Created timeline %s with %d clips from %d sequences' % (self._project_name, len(all_shot_entries), len(plans)))
+
+    def _queue_message(self, text):
+        """Buffer a log line for the UI, emitting in batches to limit queued signals.
+
+        The loader thread has no event loop, so callers flush explicitly before
+        blocking phases.
+        """
+        self._pending_messages.append(text)
+        self._flush_if_due()
+
+    def _flush_if_due(self):
+        if not self._message_timer.isValid():
+            self._message_timer.start()
+        if (len(self._pending_messages) >= _MESSAGE_BATCH_SIZE
+                or self._message_timer.elapsed() >= _MESSAGE_FLUSH_INTERVAL_MS):
+            self._flush_messages()
+
+    def _flush_messages(self):
+        """Emit buffered log lines, then the latest progress value if it changed."""
+        if self._pending_messages:
+            self.message.emit('\n'.join(self._pending_messages))
+            self._pending_messages = []
+        percent = self._pending_progress
+        self._pending_progress = None
+        if percent is not None and percent != self._last_progress:
+            self._last_progress = percent
+            self.progress.emit(percent)
+        self._message_timer.start()
 
     def _emit_error(self, code, message, shot=None, sequence_name=None):
+        # Keep buffered messages ahead of the error in the UI log
+        self._flush_messages()
         payload = {
             'code': code,
             'message': message,
@@ -182,8 +298,7 @@ class LoaderThread(QtCore.QThread):
         normalized_path = self._normalize_hiero_path(media_path)
         LOGGER.info('Normalized path: %s', normalized_path)
         try:
-            root_bin = self._invoke_on_main_thread(lambda: project.clipsBin())
-            LOGGER.debug('Got project clips bin')
+            root_bin = self._get_root_bin(project)
         except Exception as exc:
             LOGGER.exception('Failed to access project clips bin: %s', exc)
             return False, 'Cannot access project clips bin: %s' % exc
@@ -228,8 +343,7 @@ class LoaderThread(QtCore.QThread):
         normalized_path = self._normalize_hiero_path(media_path)
         LOGGER.info('Normalized render path: %s', normalized_path)
         try:
-            root_bin = self._invoke_on_main_thread(lambda: project.clipsBin())
-            LOGGER.debug('Got project clips bin')
+            root_bin = self._get_root_bin(project)
         except Exception as exc:
             LOGGER.exception('Failed to access project clips bin: %s', exc)
             return False, 'Cannot access project clips bin: %s' % exc
@@ -257,38 +371,52 @@ class LoaderThread(QtCore.QThread):
         }
 
     def _find_or_create_bin(self, root_bin, name):
+        # Every caller passes the project root bin, so the name is a sufficient key.
+        cached_bin = self._bin_cache.get(name)
+        if cached_bin is not None:
+            return cached_bin
         LOGGER.debug('Finding or creating bin: %s', name)
+
+        def find_or_create_bin():
+            # Lookup and creation share one main thread hop.
+            try:
+                for item in root_bin.items():
+                    if isinstance(item, hiero.core.Bin) and item.name() == name:
+                        return item, False
+            except Exception as exc:
+                LOGGER.warning('Could not iterate bin items: %s', exc)
+            new_bin = hiero.core.Bin(name)
+            root_bin.addItem(new_bin)
+            return new_bin, True
+
         try:
-            items = self._invoke_on_main_thread(lambda: root_bin.items())
-            for item in items:
-                if isinstance(item, hiero.core.Bin) and item.name() == name:
-                    LOGGER.debug('Found existing bin (direct): %s', name)
-                    return item
-        except Exception as exc:
-            LOGGER.warning('Could not iterate bin items: %s', exc)
-        LOGGER.debug('Creating new bin: %s', name)
-        try:
-            def create_bin():
-                new_bin = hiero.core.Bin(name)
-                root_bin.addItem(new_bin)
-                return new_bin
-            new_bin = self._invoke_on_main_thread(create_bin)
-            LOGGER.info('Created bin %s and added to root', name)
-            return new_bin
+            found_bin, created = self._invoke_on_main_thread(find_or_create_bin)
         except Exception as exc:
             LOGGER.exception('Failed to create/add bin %s: %s', name, exc)
             return None
+        if created:
+            LOGGER.info('Created bin %s and added to root', name)
+        else:
+            LOGGER.debug('Found existing bin (direct): %s', name)
+        self._bin_cache[name] = found_bin
+        return found_bin
 
     def _normalize_hiero_path(self, path_value):
+        # Remap rules do not change during a run, so each path is resolved once
+        cached = self._path_norm_cache.get(path_value)
+        if cached is not None:
+            return cached
         # Use forward slashes instead of backslashes
         normalized = path_value.replace('\\', '/')
         if hiero is not None:
             try:
-                normalized = hiero.core.remapPath(normalized)
-                # Ensure forward slashes after remapPath
-                normalized = normalized.replace('\\', '/')
+                remapped = hiero.core.remapPath(normalized)
+                # Only rescan for backslashes when remapPath changed the path
+                if remapped != normalized:
+                    normalized = remapped.replace('\\', '/')
             except Exception:  # pragma: no cover
                 pass
+        self._path_norm_cache[path_value] = normalized
         return normalized
 
     def _resolve_imported_clip(self, footage_bin, imported_result):
@@ -336,78 +464,128 @@ class LoaderThread(QtCore.QThread):
     def _prepare_sequence_plans(self):
         plans = []
         errors = []
+        if self._cancel:
+            return plans, errors
         for sequence in self._sequences:
-            if self._cancel:
-                break
-            sequence_name = sequence.get('name')
-            self.message.emit('Fetching shots for sequence %s' % sequence_name)
-            ok, shots = kitsu_client.get_shots_for_sequence(sequence.get('id'))
-            if not ok:
-                errors.append(self._emit_error('KITSU_ERROR', unicode(shots), sequence_name=sequence_name))
-                continue
-            if not shots:
-                errors.append(self._emit_error('MISSING_SHOTS', 'Sequence has no shots', sequence_name=sequence_name))
-                continue
-            plans.append({
-                'sequence': sequence,
-                'shots': shots,
-                'task_names': sequence.get('tasks', []),  # List of task names
-            })
+            self._queue_message('Fetching shots for sequence %s' % sequence.get('name'))
+        with closing(self._iter_kitsu(self._fetch_sequence_shots, self._sequences)) as shot_lookups:
+            for sequence, (ok, shots) in shot_lookups:
+                if self._cancel:
+                    break
+                sequence_name = sequence.get('name')
+                if not ok:
+                    errors.append(self._emit_error('KITSU_ERROR', unicode(shots), sequence_name=sequence_name))
+                    continue
+                if not shots:
+                    errors.append(self._emit_error('MISSING_SHOTS', 'Sequence has no shots', sequence_name=sequence_name))
+                    continue
+                plans.append({
+                    'sequence': sequence,
+                    'shots': shots,
+                    'task_names': sequence.get('tasks', []),  # List of task names
+                })
         return plans, errors
 
-    def _process_sequence_plan_for_combined_timeline(self, plan, all_shot_entries, all_task_names, all_errors):
-        """Process a sequence and add its shots to the combined timeline."""
-        sequence = plan['sequence']
-        sequence_name = sequence.get('name')
-        task_names = plan.get('task_names', [])
-        all_task_names.update(task_names)
-        shot_entries = []
-        errors = []
-        
-        # Process all shots for plates (from Conforming task)
+    def _fetch_sequence_shots(self, sequence):
+        return kitsu_client.get_shots_for_sequence(sequence.get('id'))
+
+    def _fetch_conform_comment(self, shot):
+        lookup = kitsu_client.get_latest_conform_comment(shot.get('id'))
+        ok, comment = lookup
+        if ok:
+            location = utils.extract_location_from_comment(comment)
+            if location:
+                self._prefetch_path_exists(kitsu_client.translate_repo_path_to_unc(location))
+        return lookup
+
+    def _fetch_task_lookups(self, pair):
+        """Return the raw Kitsu (workfile, render) lookups for one ``(task_name, entry, shot)``."""
+        task_name, _, shot = pair
+        render_lookup = kitsu_client.get_latest_render_for_shot(shot.get('id'), task_name)
+        ok, render_path = render_lookup
+        if ok and render_path:
+            self._prefetch_path_exists(render_path)
+        return (
+            kitsu_client.get_latest_workfile_for_shot(shot.get('id'), task_name),
+            render_lookup,
+        )
+
+    def _prefetch_path_exists(self, path_value):
+        """Stat ``path_value`` from a pool worker so the import loop can reuse the answer."""
+        if path_value and path_value not in self._path_exists_cache:
+            self._path_exists_cache[path_value] = utils.path_exists(path_value)
+
+    def _path_exists(self, path_value):
+        exists = self._path_exists_cache.get(path_value)
+        if exists is None:
+            exists = self._path_exists_cache[path_value] = utils.path_exists(path_value)
+        return exists
+
+    def _collect_task_paths(self, plan, shot_entries, task_names, errors):
+        """Attach workfile and render info for every selected task to the shot entries."""
+        sequence_name = plan['sequence'].get('name')
+        # Index the original shot dicts by name once; the first shot wins on
+        # duplicate names, as the previous linear scan did.
+        shots_by_name = {}
         for shot in plan['shots']:
-            if self._cancel:
-                break
-            shot_result = self._process_shot_plate(sequence_name, shot)
-            fatal = shot_result.get('fatal_error')
-            if fatal:
-                errors.append(fatal)
-            else:
-                entry = shot_result.get('entry')
-                if entry:
-                    shot_entries.append(entry)
-                errors.extend(shot_result.get('warnings', []))
-            self._processed_shots += 1
-            self._emit_progress()
-        
-        # For each selected task, fetch workfiles and renders for all shots
+            shots_by_name.setdefault(shot.get('name'), shot)
+        pairs = []
         for task_name in task_names:
             for entry in shot_entries:
+                shot = shots_by_name.get(entry['shot'])
+                if shot:
+                    pairs.append((task_name, entry, shot))
+        if not pairs or self._cancel:
+            return
+        # Kitsu metadata for every (task, shot) pair is fetched up front and in
+        # parallel; the Hiero imports below stay sequential.
+        with closing(self._iter_kitsu(self._fetch_task_lookups, pairs)) as lookups:
+            for (task_name, entry, shot), (workfile_lookup, render_lookup) in lookups:
                 if self._cancel:
                     break
-                shot_name = entry['shot']
-                # Find the original shot dict
-                shot = next((s for s in plan['shots'] if s.get('name') == shot_name), None)
-                if not shot:
-                    continue
-                
                 # Get workfile path
-                script_path, warning = self._retrieve_script_path(shot, task_name, sequence_name)
+                script_path, warning = self._retrieve_script_path(shot, task_name, sequence_name, workfile_lookup)
                 if warning:
                     errors.append(warning)
                 # Add workfile paths to entry, keyed by task name
-                if 'workfiles' not in entry:
-                    entry['workfiles'] = {}
-                entry['workfiles'][task_name] = script_path
-                
+                entry.setdefault('workfiles', {})[task_name] = script_path
+
                 # Get render path and import it
-                render_result = self._retrieve_render_path(shot, task_name, sequence_name)
+                render_result = self._retrieve_render_path(shot, task_name, sequence_name, render_lookup)
                 if render_result.get('error'):
                     errors.append(render_result['error'])
                 # Add render info to entry, keyed by task name
-                if 'renders' not in entry:
-                    entry['renders'] = {}
-                entry['renders'][task_name] = render_result.get('render_info')
+                entry.setdefault('renders', {})[task_name] = render_result.get('render_info')
+
+    def _process_sequence_plan_for_combined_timeline(self, plan, all_shot_entries, all_task_names, all_errors):
+        """Process a sequence and add its shots to the combined timeline."""
+        sequence = plan['sequence']
+        sequence_name = sequence.get('name')
+        task_names = plan.get('task_names', [])
+        all_task_names.update(task_names)
+        shot_entries = []
+        errors = []
+        
+        # Process all shots for plates (from Conforming task); the conform
+        # comments are fetched concurrently before the sequential imports.
+        with closing(self._iter_kitsu(self._fetch_conform_comment, plan['shots'])) as conform_lookups:
+            for shot, conform_lookup in conform_lookups:
+                if self._cancel:
+                    break
+                shot_result = self._process_shot_plate(sequence_name, shot, conform_lookup)
+                fatal = shot_result.get('fatal_error')
+                if fatal:
+                    errors.append(fatal)
+                else:
+                    entry = shot_result.get('entry')
+                    if entry:
+                        shot_entries.append(entry)
+                    errors.extend(shot_result.get('warnings', []))
+                self._processed_shots += 1
+                self._emit_progress()
+        
+        # For each selected task, fetch workfiles and renders for all shots
+        self._collect_task_paths(plan, shot_entries, task_names, errors)
         
         # Add this sequence's shots to the combined list
         all_shot_entries.extend(shot_entries)
@@ -427,53 +605,29 @@ class LoaderThread(QtCore.QThread):
         shot_entries = []
         errors = []
         
-        # Process all shots for plates (from Conforming task)
-        for shot in plan['shots']:
-            if self._cancel:
-                break
-            shot_result = self._process_shot_plate(sequence_name, shot)
-            fatal = shot_result.get('fatal_error')
-            if fatal:
-                errors.append(fatal)
-            else:
-                entry = shot_result.get('entry')
-                if entry:
-                    shot_entries.append(entry)
-                errors.extend(shot_result.get('warnings', []))
-            self._processed_shots += 1
-            self._emit_progress()
-        
-        # For each selected task, fetch workfiles and renders for all shots
-        for task_name in task_names:
-            for entry in shot_entries:
+        # Process all shots for plates (from Conforming task); the conform
+        # comments are fetched concurrently before the sequential imports.
+        with closing(self._iter_kitsu(self._fetch_conform_comment, plan['shots'])) as conform_lookups:
+            for shot, conform_lookup in conform_lookups:
                 if self._cancel:
                     break
-                shot_name = entry['shot']
-                # Find the original shot dict
-                shot = next((s for s in plan['shots'] if s.get('name') == shot_name), None)
-                if not shot:
-                    continue
-                
-                # Get workfile path
-                script_path, warning = self._retrieve_script_path(shot, task_name, sequence_name)
-                if warning:
-                    errors.append(warning)
-                # Add workfile paths to entry, keyed by task name
-                if 'workfiles' not in entry:
-                    entry['workfiles'] = {}
-                entry['workfiles'][task_name] = script_path
-                
-                # Get render path
-                render_result = self._retrieve_render_path(shot, task_name, sequence_name)
-                if render_result.get('error'):
-                    errors.append(render_result['error'])
-                # Add render paths to entry, keyed by task name
-                if 'renders' not in entry:
-                    entry['renders'] = {}
-                entry['renders'][task_name] = render_result.get('render_info')
+                shot_result = self._process_shot_plate(sequence_name, shot, conform_lookup)
+                fatal = shot_result.get('fatal_error')
+                if fatal:
+                    errors.append(fatal)
+                else:
+                    entry = shot_result.get('entry')
+                    if entry:
+                        shot_entries.append(entry)
+                    errors.extend(shot_result.get('warnings', []))
+                self._processed_shots += 1
+                self._emit_progress()
+        
+        # For each selected task, fetch workfiles and renders for all shots
+        self._collect_task_paths(plan, shot_entries, task_names, errors)
         
         if not shot_entries:
-            self.message.emit('No plates imported for sequence %s' % sequence_name)
+            self._queue_message('No plates imported for sequence %s' % sequence_name)
             return {
                 'sequence': sequence_name,
                 'shots_requested': len(plan['shots']),
@@ -484,7 +638,7 @@ class LoaderThread(QtCore.QThread):
         if not ok:
             errors.append(self._emit_error('HIERO_ERROR', unicode(payload), sequence_name=sequence_name))
         else:
-            self.message.emit('Created sequence %s with %d clips' % (sequence_name, len(shot_entries)))
+            self._queue_message('Created sequence %s with %d clips' % (sequence_name, len(shot_entries)))
         return {
             'sequence': sequence_name,
             'shots_requested': len(plan['shots']),
@@ -492,22 +646,24 @@ class LoaderThread(QtCore.QThread):
             'errors': errors,
         }
 
-    def _process_shot_plate(self, sequence_name, shot):
+    def _process_shot_plate(self, sequence_name, shot, conform_lookup=None):
         """Process a single shot to import its plate from Conforming task."""
         shot_name = shot.get('name')
-        ok, comment = kitsu_client.get_latest_conform_comment(shot.get('id'))
+        if conform_lookup is None:
+            conform_lookup = self._fetch_conform_comment(shot)
+        ok, comment = conform_lookup
         if not ok:
             return {'fatal_error': self._emit_error('KITSU_ERROR', unicode(comment), shot=shot_name, sequence_name=sequence_name)}
         location = utils.extract_location_from_comment(comment)
         if not location:
             return {'fatal_error': self._emit_error('MISSING_LOCATION', 'No location found in conform comment', shot=shot_name, sequence_name=sequence_name)}
         location = kitsu_client.translate_repo_path_to_unc(location)
-        if not utils.path_exists(location):
+        if not self._path_exists(location):
             return {'fatal_error': self._emit_error('UNREACHABLE_PATH', 'Path not reachable: %s' % location, shot=shot_name, sequence_name=sequence_name)}
         ok, clip_payload = self._import_clip_to_footage_bin(location)
         if not ok:
             return {'fatal_error': self._emit_error('HIERO_ERROR', unicode(clip_payload), shot=shot_name, sequence_name=sequence_name)}
-        self.message.emit('Imported plate for shot %s from %s' % (shot_name, location))
+        self._queue_message('Imported plate for shot %s from %s' % (shot_name, location))
         return {
             'entry': {
                 'shot': shot_name,
@@ -518,35 +674,39 @@ class LoaderThread(QtCore.QThread):
             'warnings': [],
         }
 
-    def _retrieve_script_path(self, shot, task_name, sequence_name):
+    def _retrieve_script_path(self, shot, task_name, sequence_name, lookup=None):
         if not task_name:
             return None, None
         shot_name = shot.get('name')
-        ok, result = kitsu_client.get_latest_workfile_for_shot(shot.get('id'), task_name)
+        if lookup is None:
+            lookup = kitsu_client.get_latest_workfile_for_shot(shot.get('id'), task_name)
+        ok, result = lookup
         if not ok:
             return None, self._emit_error('KITSU_ERROR', unicode(result), shot=shot_name, sequence_name=sequence_name)
         if not result:
             LOGGER.debug('No %s workfile found for shot %s', task_name, shot_name)
             return None, None  # Not an error, just no workfile yet
-        script_path = kitsu_client.translate_repo_path_to_unc(result)
+        script_path = result  # already translated to a UNC path by kitsu_client
         # Don't validate path existence - let Hiero import handle it with fallback to placeholder
         LOGGER.debug('Found workfile for %s task: %s', task_name, script_path)
         return script_path, None
 
-    def _retrieve_render_path(self, shot, task_name, sequence_name):
+    def _retrieve_render_path(self, shot, task_name, sequence_name, lookup=None):
         """Retrieve render location from task comments and import the clip."""
         if not task_name:
             return {'render_info': None}
         shot_name = shot.get('name')
-        ok, result = kitsu_client.get_latest_render_for_shot(shot.get('id'), task_name)
+        if lookup is None:
+            lookup = kitsu_client.get_latest_render_for_shot(shot.get('id'), task_name)
+        ok, result = lookup
         if not ok:
             return {'error': self._emit_error('KITSU_ERROR', unicode(result), shot=shot_name, sequence_name=sequence_name)}
         if not result:
             LOGGER.debug('No %s render found for shot %s', task_name, shot_name)
             return {'render_info': None}  # Not an error, just no render yet
         
-        render_path = kitsu_client.translate_repo_path_to_unc(result)
-        if not utils.path_exists(render_path):
+        render_path = result  # already translated to a UNC path by kitsu_client
+        if not self._path_exists(render_path):
             return {'error': self._emit_error('UNREACHABLE_PATH', 'Render path not reachable: %s' % render_path, shot=shot_name, sequence_name=sequence_name)}
         
         # Import render clip to Render bin
@@ -554,7 +714,7 @@ class LoaderThread(QtCore.QThread):
         if not ok:
             return {'error': self._emit_error('HIERO_ERROR', unicode(clip_payload), shot=shot_name, sequence_name=sequence_name)}
         
-        self.message.emit('Imported render for shot %s from %s' % (shot_name, render_path))
+        self._queue_message('Imported render for shot %s from %s' % (shot_name, render_path))
         return {
             'render_info': {
                 'clip': clip_payload.get('clip'),
@@ -563,6 +723,7 @@ class LoaderThread(QtCore.QThread):
         }
 
     def _build_sequence_timeline(self, sequence_name, shot_entries, task_names):
+        self._flush_messages()
         project = self._get_active_project()
         if project is None:
             return False, 'No active Hiero project available.'
@@ -579,73 +740,48 @@ class LoaderThread(QtCore.QThread):
             except Exception as exc:
                 LOGGER.debug('Could not set framerate: %s', exc)
             
-            # Create footage track
-            LOGGER.debug('Creating footage track')
-            footage_track = self._invoke_on_main_thread(lambda: hiero.core.VideoTrack('footage'))
-            self._invoke_on_main_thread(lambda: sequence_obj.addTrack(footage_track))
-            
-            # Create comp track and render track for each selected task
+            # Create the footage track plus a comp and render track per selected
+            # task in a single main thread round trip.
+            LOGGER.debug('Creating footage, comp and render tracks for tasks: %s', task_names)
+            track_calls = [(_add_video_track, (sequence_obj, 'footage'))]
+            for task_name in task_names:
+                track_calls.append((_add_video_track, (sequence_obj, task_name)))
+                track_calls.append((_add_video_track, (sequence_obj, '%s_render' % task_name)))
+            tracks = self._invoke_batch_on_main_thread(track_calls)
+            footage_track = tracks[0]
             comp_tracks = {}
             render_tracks = {}
-            for task_name in task_names:
-                LOGGER.debug('Creating comp track for task: %s', task_name)
-                comp_track = self._invoke_on_main_thread(lambda tn=task_name: hiero.core.VideoTrack(tn))
-                self._invoke_on_main_thread(lambda ct=comp_track: sequence_obj.addTrack(ct))
-                comp_tracks[task_name] = comp_track
-                
-                LOGGER.debug('Creating render track for task: %s', task_name)
-                render_track_name = '%s_render' % task_name
-                render_track = self._invoke_on_main_thread(lambda rtn=render_track_name: hiero.core.VideoTrack(rtn))
-                self._invoke_on_main_thread(lambda rt=render_track: sequence_obj.addTrack(rt))
-                render_tracks[task_name] = render_track
+            for idx, task_name in enumerate(task_names):
+                comp_tracks[task_name] = tracks[1 + 2 * idx]
+                render_tracks[task_name] = tracks[2 + 2 * idx]
             
             timeline_in = 0
             for idx, entry in enumerate(shot_entries):
                 LOGGER.debug('Processing shot entry %d/%d: %s', idx + 1, len(shot_entries), entry.get('shot'))
-                clip = entry['clip']
-                if clip is None:
+                if entry['clip'] is None:
                     LOGGER.warning('Clip is None for shot %s, skipping', entry.get('shot'))
                     continue
-                duration = self._clip_duration(clip)
-                LOGGER.debug('Shot %s duration: %d frames', entry.get('shot'), duration)
-                
-                # Add plate to footage track
                 try:
-                    def create_and_add_footage_item():
-                        track_item = footage_track.createTrackItem('%s_plate' % entry['shot'])
-                        track_item.setSource(clip)
-                        track_item.setTimelineIn(timeline_in)
-                        track_item.setTimelineOut(timeline_in + duration - 1)
-                        footage_track.addItem(track_item)
-                        return track_item
-                    self._invoke_on_main_thread(create_and_add_footage_item)
-                    LOGGER.debug('Added footage track item for %s at timeline %d-%d', entry['shot'], timeline_in, timeline_in + duration - 1)
+                    duration = self._invoke_on_main_thread(self._create_footage_item, footage_track, entry, timeline_in)
                 except Exception as exc:
                     LOGGER.exception('Failed to create footage track item for %s: %s', entry.get('shot'), exc)
                     continue
-                
-                # Add workfile for each selected task to corresponding comp track
-                workfiles = entry.get('workfiles', {})
-                renders = entry.get('renders', {})
-                for task_name in task_names:
-                    # Add script/workfile to comp track
-                    script_path = workfiles.get(task_name)
-                    if script_path:
-                        comp_track = comp_tracks.get(task_name)
-                        if comp_track:
-                            self._add_script_track_item(sequence_name, comp_track, entry, script_path, timeline_in, timeline_in + duration - 1)
-                    
-                    # Add render to render track
-                    render_info = renders.get(task_name)
-                    if render_info and render_info.get('clip'):
-                        render_track = render_tracks.get(task_name)
-                        if render_track:
-                            self._add_render_track_item(sequence_name, render_track, entry, render_info, timeline_in, timeline_in + duration - 1)
-                
+                timeline_out = timeline_in + duration - 1
+                # Scripts are only imported once the shot is known to be on the timeline
+                script_assets = self._import_shot_script_assets(sequence_name, entry, task_names)
+                # All comp and render items for the shot are created in one hop
+                result = self._invoke_on_main_thread(
+                    self._create_task_items, entry, timeline_in, timeline_out, task_names,
+                    comp_tracks, render_tracks, script_assets)
+                for linked_message in result['linked']:
+                    self._queue_message(linked_message)
+                for failure in result['failures']:
+                    self._emit_error('HIERO_ERROR', failure, shot=entry['shot'], sequence_name=sequence_name)
                 timeline_in += duration
                 
             LOGGER.info('Adding sequence to project clips bin')
-            self._invoke_on_main_thread(lambda: project.clipsBin().addItem(hiero.core.BinItem(sequence_obj)))
+            root_bin = self._get_root_bin(project)
+            self._invoke_on_main_thread(lambda: root_bin.addItem(hiero.core.BinItem(sequence_obj)))
             LOGGER.info('Successfully created sequence %s', sequence_name)
         except Exception as exc:  # pragma: no cover - host specific
             LOGGER.exception('Failed to build sequence %s: %s', sequence_name, exc)
@@ -672,41 +808,95 @@ class LoaderThread(QtCore.QThread):
         self._project = projects[-1]
         return self._project
 
-    def _emit_progress(self):
-        percent = int((self._processed_shots / float(self._total_shots)) * 100) if self._total_shots else 100
-        self.progress.emit(percent)
+    def _get_root_bin(self, project):
+        """Return the project's clips bin, fetched from the main thread only once."""
+        if self._root_bin is None:
+            self._root_bin = self._invoke_on_main_thread(lambda: project.clipsBin())
+            LOGGER.debug('Got project clips bin')
+        return self._root_bin
 
-    def _add_script_track_item(self, sequence_name, scripts_track, entry, script_path, timeline_in, timeline_out):
-        if not script_path:
-            LOGGER.debug('No script path for shot %s', entry.get('shot'))
-            return
-        LOGGER.debug('Adding script track item for shot %s, path: %s', entry.get('shot'), script_path)
-        ok, asset = self._import_script_asset(script_path)
-        if not ok:
-            LOGGER.warning('Script asset import failed for %s: %s', entry.get('shot'), asset)
-            self._emit_error('HIERO_ERROR', unicode(asset), shot=entry['shot'], sequence_name=sequence_name)
-            return
-        try:
-            def create_and_add_script_item():
-                script_item = scripts_track.createTrackItem('%s_script' % entry['shot'])
-                source = asset.get('clip') or asset.get('placeholder_sequence')
-                if source is not None:
-                    try:
-                        script_item.setSource(source)
-                        LOGGER.debug('Set script track item source for %s', entry['shot'])
-                    except Exception as exc:
-                        LOGGER.debug('Could not set script source: %s', exc)
-                script_item.setTimelineIn(timeline_in)
-                script_item.setTimelineOut(timeline_out)
-                self._label_script_item(script_item, asset.get('path') or script_path, entry['shot'])
-                scripts_track.addItem(script_item)
-                return script_item
-            self._invoke_on_main_thread(create_and_add_script_item)
-            LOGGER.info('Added script track item for shot %s', entry['shot'])
-            self.message.emit('Linked script %s to shot %s' % (os.path.basename(asset.get('path') or script_path), entry['shot']))
-        except Exception as exc:  # pragma: no cover - host specific
-            LOGGER.exception('Failed to add script track item for %s: %s', entry['shot'], exc)
-            self._emit_error('HIERO_ERROR', unicode(exc), shot=entry['shot'], sequence_name=sequence_name)
+    def _emit_progress(self):
+        # Progress rides along with the message batch so it never overtakes
+        # the log lines of the shots it reports on
+        self._pending_progress = int((self._processed_shots / float(self._total_shots)) * 100) if self._total_shots else 100
+        self._flush_if_due()
+
+    def _import_shot_script_assets(self, sequence_name, entry, task_names):
+        """Import the workfile of every selected task for a shot, keyed by task."""
+        assets = {}
+        workfiles = entry.get('workfiles', {})
+        for task_name in task_names:
+            script_path = workfiles.get(task_name)
+            if not script_path:
+                continue
+            LOGGER.debug('Importing %s script for shot %s, path: %s', task_name, entry.get('shot'), script_path)
+            ok, asset = self._import_script_asset(script_path)
+            if not ok:
+                LOGGER.warning('Script asset import failed for %s: %s', entry.get('shot'), asset)
+                self._emit_error('HIERO_ERROR', unicode(asset), shot=entry['shot'], sequence_name=sequence_name)
+                continue
+            asset.setdefault('path', script_path)
+            assets[task_name] = asset
+        return assets
+
+    def _create_footage_item(self, footage_track, entry, timeline_in):
+        """Add the shot's plate to the footage track and return its duration (main thread only)."""
+        shot_name = entry['shot']
+        clip = entry['clip']
+        duration = self._clip_duration(clip)
+        timeline_out = timeline_in + duration - 1
+        track_item = footage_track.createTrackItem('%s_plate' % shot_name)
+        track_item.setSource(clip)
+        track_item.setTimelineIn(timeline_in)
+        track_item.setTimelineOut(timeline_out)
+        footage_track.addItem(track_item)
+        LOGGER.debug('Added footage track item for %s at timeline %d-%d', shot_name, timeline_in, timeline_out)
+        return duration
+
+    def _create_task_items(self, entry, timeline_in, timeline_out, task_names, comp_tracks, render_tracks, script_assets):
+        """Create the shot's comp and render items; must run on the main thread.
+
+        Failures are collected per item and reported by the caller.
+        """
+        shot_name = entry['shot']
+        linked = []
+        failures = []
+        renders = entry.get('renders', {})
+        for task_name in task_names:
+            asset = script_assets.get(task_name)
+            if asset is not None and task_name in comp_tracks:
+                try:
+                    self._create_script_item(comp_tracks[task_name], shot_name, asset, timeline_in, timeline_out)
+                    linked.append('Linked script %s to shot %s' % (os.path.basename(asset['path']), shot_name))
+                except Exception as exc:  # pragma: no cover - host specific
+                    LOGGER.exception('Failed to add script track item for %s: %s', shot_name, exc)
+                    failures.append(unicode(exc))
+            render_info = renders.get(task_name)
+            render_track = render_tracks.get(task_name)
+            if render_info and render_info.get('clip') and render_track is not None:
+                try:
+                    self._create_render_item(render_track, shot_name, render_info, timeline_in, timeline_out)
+                    linked.append('Linked render %s to shot %s' % (os.path.basename(render_info.get('path') or 'render'), shot_name))
+                except Exception as exc:  # pragma: no cover - host specific
+                    LOGGER.exception('Failed to add render track item for %s: %s', shot_name, exc)
+                    failures.append(unicode(exc))
+        return {'linked': linked, 'failures': failures}
+
+    def _create_script_item(self, scripts_track, shot_name, asset, timeline_in, timeline_out):
+        script_item = scripts_track.createTrackItem('%s_script' % shot_name)
+        source = asset.get('clip') or asset.get('placeholder_sequence')
+        if source is not None:
+            try:
+                script_item.setSource(source)
+                LOGGER.debug('Set script track item source for %s', shot_name)
+            except Exception as exc:
+                LOGGER.debug('Could not set script source: %s', exc)
+        script_item.setTimelineIn(timeline_in)
+        script_item.setTimelineOut(timeline_out)
+        self._label_script_item(script_item, asset['path'], shot_name)
+        scripts_track.addItem(script_item)
+        LOGGER.info('Added script track item for shot %s', shot_name)
+        return script_item
 
     def _import_script_asset(self, script_path):
         LOGGER.debug('Importing script asset: %s', script_path)
@@ -721,7 +911,7 @@ class LoaderThread(QtCore.QThread):
                 return False, 'Unable to create Hiero project: %s' % exc
         normalized_path = self._normalize_hiero_path(script_path)
         LOGGER.debug('Normalized script path: %s', normalized_path)
-        scripts_bin = self._find_or_create_bin(self._invoke_on_main_thread(lambda: project.clipsBin()), 'Scripts')
+        scripts_bin = self._find_or_create_bin(self._get_root_bin(project), 'Scripts')
         if scripts_bin is None:
             return False, 'Could not create Scripts bin'
         try:
@@ -789,37 +979,25 @@ class LoaderThread(QtCore.QThread):
                 continue
         LOGGER.info('Script path for %s: %s', shot_name, script_path)
 
-    def _add_render_track_item(self, sequence_name, render_track, entry, render_info, timeline_in, timeline_out):
+    def _create_render_item(self, render_track, shot_name, render_info, timeline_in, timeline_out):
         """Add a render clip as a track item to the render track."""
-        render_clip = render_info.get('clip')
         render_path = render_info.get('path')
-        if not render_clip:
-            LOGGER.debug('No render clip for shot %s', entry.get('shot'))
-            return
-        LOGGER.debug('Adding render track item for shot %s, path: %s', entry.get('shot'), render_path)
+        render_item = render_track.createTrackItem('%s_render' % shot_name)
         try:
-            def create_and_add_render_item():
-                render_item = render_track.createTrackItem('%s_render' % entry['shot'])
-                try:
-                    render_item.setSource(render_clip)
-                    LOGGER.debug('Set render track item source for %s', entry['shot'])
-                except Exception as exc:
-                    LOGGER.debug('Could not set render source: %s', exc)
-                render_item.setTimelineIn(timeline_in)
-                render_item.setTimelineOut(timeline_out)
-                # Add metadata
-                try:
-                    metadata = render_item.metadata()
-                    if metadata:
-                        metadata.setValue('kitsu.render_path', render_path)
-                        render_item.setMetadata(metadata)
-                except Exception as exc:
-                    LOGGER.debug('Could not set render metadata: %s', exc)
-                render_track.addItem(render_item)
-                return render_item
-            self._invoke_on_main_thread(create_and_add_render_item)
-            LOGGER.info('Added render track item for shot %s', entry['shot'])
-            self.message.emit('Linked render %s to shot %s' % (os.path.basename(render_path or 'render'), entry['shot']))
-        except Exception as exc:  # pragma: no cover - host specific
-            LOGGER.exception('Failed to add render track item for %s: %s', entry['shot'], exc)
-            self._emit_error('HIERO_ERROR', unicode(exc), shot=entry['shot'], sequence_name=sequence_name)
+            render_item.setSource(render_info.get('clip'))
+            LOGGER.debug('Set render track item source for %s', shot_name)
+        except Exception as exc:
+            LOGGER.debug('Could not set render source: %s', exc)
+        render_item.setTimelineIn(timeline_in)
+        render_item.setTimelineOut(timeline_out)
+        # Add metadata
+        try:
+            metadata = render_item.metadata()
+            if metadata:
+                metadata.setValue('kitsu.render_path', render_path)
+                render_item.setMetadata(metadata)
+        except Exception as exc:
+            LOGGER.debug('Could not set render metadata: %s', exc)
+        render_track.addItem(render_item)
+        LOGGER.info('Added render track item for shot %s', shot_name)
+        return render_item
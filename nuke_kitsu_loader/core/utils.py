@@ -6,6 +6,11 @@ from __future__ import absolute_import
 import os
 import re
 
+try:  # pragma: no cover - concurrent.futures is stdlib on Python 3 only
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover - Python 2 without the futures backport
+    ThreadPoolExecutor = None
+
 LOCATION_PATTERN = re.compile(r'location\s*:\s*(.+)', re.IGNORECASE)
 WORKFILE_PATTERN = re.compile(r'workfile\s*:\s*(.+)', re.IGNORECASE)
 FIELD_BACKTICK_PATTERNS = {
@@ -144,3 +149,30 @@ def path_exists(path_value):
     if not path_value:
         return False
     return os.path.exists(path_value)
+
+
+def create_thread_pool(max_workers):
+    """Return a ``ThreadPoolExecutor``, or ``None`` where concurrent.futures is unavailable."""
+    if ThreadPoolExecutor is None:
+        return None
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def iter_concurrently(executor, func, items):
+    """Yield ``(item, func(item))`` pairs in input order, running the calls on ``executor``.
+
+    Without an executor the calls run serially as the pairs are consumed. Calls
+    still queued are cancelled when the consumer stops early or a call raises.
+    """
+    items = list(items)
+    if executor is None or len(items) < 2:
+        for item in items:
+            yield item, func(item)
+        return
+    futures = [executor.submit(func, item) for item in items]
+    try:
+        for item, future in zip(items, futures):
+            yield item, future.result()
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for nuke_kitsu_loader.core.debug."""
+
+from __future__ import absolute_import
+
+import unittest
+
+from nuke_kitsu_loader.core import debug
+
+
+class DebugTests(unittest.TestCase):
+    """Exercise the summary sanitizer."""
+
+    def test_sanitize_converts_nested_payloads(self):
+        payload = {
+            'sequences': [{'name': 'sq010', 'errors': ({'code': 'MISSING_FILE', 'shot': None},)}],
+            'processed_shots': 3,
+            'ratio': 0.5,
+            'ok': True,
+            'clip': object,
+            42: 'dropped',
+        }
+        sanitized = debug._sanitize(payload)  # pylint: disable=protected-access
+        self.assertEqual(sanitized['sequences'], [{'name': 'sq010', 'errors': [{'code': 'MISSING_FILE', 'shot': None}]}])
+        self.assertEqual(sanitized['processed_shots'], 3)
+        self.assertEqual(sanitized['ratio'], 0.5)
+        self.assertIs(sanitized['ok'], True)
+        self.assertEqual(sanitized['clip'], str(object))
+        self.assertNotIn(42, sanitized)
+
+    def test_sanitize_handles_deep_nesting(self):
+        payload = current = []
+        for _ in range(5000):
+            child = []
+            current.append(child)
+            current = child
+        sanitized = debug._sanitize(payload)  # pylint: disable=protected-access
+        depth = 0
+        while sanitized:
+            sanitized = sanitized[0]
+            depth += 1
+        self.assertEqual(depth, 5000)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -3,28 +3,49 @@
 
 from __future__ import absolute_import
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
 from nuke_kitsu_loader.core import kitsu_client, utils
 
 
+class _FakeProjectModule(object):
+    def __init__(self):
+        self.projects = []
+
+    def all_projects(self):
+        return list(self.projects)
+
+
 class _FakeShotModule(object):
     def __init__(self, tasks_map):
         self._tasks_map = tasks_map
+        self.shots_map = {}
+        self.offline = False
 
     def get_shot(self, shot_id):
         return {'id': shot_id}
 
-    def all_shots_for_sequence(self, sequence):  # pragma: no cover - not used here
-        return self._tasks_map.get(sequence.get('id'), [])
+    def get_sequence(self, sequence_id):
+        if self.offline:
+            raise IOError('Kitsu unreachable')
+        return {'id': sequence_id}
+
+    def all_shots_for_sequence(self, sequence):
+        return list(self.shots_map.get(sequence.get('id'), []))
 
 
 class _FakeTaskModule(object):
     def __init__(self, tasks_map, comments_map):
         self._tasks_map = tasks_map
         self._comments_map = comments_map
+        self.task_requests = 0
 
     def all_tasks_for_shot(self, shot):
+        self.task_requests += 1
         return self._tasks_map.get(shot.get('id'), [])
 
     def all_comments_for_task(self, task):
@@ -38,6 +59,7 @@ class _FakeGazu(object):
     def __init__(self, tasks_map, comments_map):
         self.task = _FakeTaskModule(tasks_map, comments_map)
         self.shot = _FakeShotModule(tasks_map)
+        self.project = _FakeProjectModule()
 
 
 class KitsuClientTests(unittest.TestCase):
@@ -46,6 +68,10 @@ class KitsuClientTests(unittest.TestCase):
     def setUp(self):
         self._orig_gazu = kitsu_client.gazu
         self._orig_config = kitsu_client._CONFIG  # pylint: disable=protected-access
+        self._orig_config_mtime = kitsu_client._CONFIG_MTIME  # pylint: disable=protected-access
+        self._orig_config_path = kitsu_client._CONFIG_PATH  # pylint: disable=protected-access
+        self._orig_cache_dir = kitsu_client._DISK_CACHE_DIR  # pylint: disable=protected-access
+        kitsu_client._DISK_CACHE_DIR = tempfile.mkdtemp()  # pylint: disable=protected-access
         self._tasks_map = {
             'shot-1': [
                 {'id': 'task-10', 'task_type': {'name': 'Conforming'}},
@@ -54,6 +80,10 @@ class KitsuClientTests(unittest.TestCase):
             'shot-2': [
                 {'id': 'task-30', 'task_type': {'name': 'Lighting'}},
             ],
+            'shot-3': [
+                {'id': 'task-40', 'task_type': {'name': 'Conforming'}},
+                {'id': 'task-50', 'task_type': {'name': 'Conform'}},
+            ],
         }
         self._comments_map = {
             'task-10': [
@@ -79,16 +109,33 @@ class KitsuClientTests(unittest.TestCase):
                     'created_at': '2024-02-02T09:00:00',
                 },
             ],
+            'task-40': [
+                {'text': 'location: /mnt/showA/seq01/shot030/plates/old.mov', 'created_at': '2024-01-05T10:00:00'},
+            ],
+            'task-50': [
+                {'text': 'location: /mnt/showA/seq01/shot030/plates/new.mov', 'created_at': '2024-03-05T10:00:00'},
+            ],
         }
         self._fake = _FakeGazu(self._tasks_map, self._comments_map)
         kitsu_client.gazu = self._fake
+        kitsu_client.invalidate_shot_cache()
         kitsu_client._SESSION['logged_in'] = True  # pylint: disable=protected-access
         kitsu_client._CONFIG = {'path_mappings': [{'match': '/mnt', 'replace': r'\\\srv'}]}  # pylint: disable=protected-access
 
     def tearDown(self):
         kitsu_client.gazu = self._orig_gazu
+        kitsu_client.invalidate_shot_cache()
         kitsu_client._SESSION['logged_in'] = False  # pylint: disable=protected-access
         kitsu_client._CONFIG = self._orig_config  # pylint: disable=protected-access
+        kitsu_client._CONFIG_MTIME = self._orig_config_mtime  # pylint: disable=protected-access
+        kitsu_client._CONFIG_PATH = self._orig_config_path  # pylint: disable=protected-access
+        self._wait_for_cache_refreshes()
+        shutil.rmtree(kitsu_client._DISK_CACHE_DIR, ignore_errors=True)  # pylint: disable=protected-access
+        kitsu_client._DISK_CACHE_DIR = self._orig_cache_dir  # pylint: disable=protected-access
+
+    def _wait_for_cache_refreshes(self):
+        for worker in list(kitsu_client._DISK_CACHE_REFRESHES.values()):  # pylint: disable=protected-access
+            worker.join()
 
     def test_get_latest_conform_comment_prefers_latest_table_entry(self):
         ok, text = kitsu_client.get_latest_conform_comment('shot-1')
@@ -96,6 +143,11 @@ class KitsuClientTests(unittest.TestCase):
         extracted = utils.extract_location_from_comment(text)
         self.assertEqual(extracted, r'/mnt/showA/seq01/shot010/plates/plate.mov')
 
+    def test_get_latest_conform_comment_merges_all_conform_tasks(self):
+        ok, text = kitsu_client.get_latest_conform_comment('shot-3')
+        self.assertTrue(ok)
+        self.assertEqual(utils.extract_location_from_comment(text), '/mnt/showA/seq01/shot030/plates/new.mov')
+
     def test_get_latest_workfile_uses_comments_and_mappings(self):
         ok, path = kitsu_client.get_latest_workfile_for_shot('shot-1', 'Compositing')
         self.assertTrue(ok)
@@ -106,6 +158,110 @@ class KitsuClientTests(unittest.TestCase):
         self.assertTrue(ok)
         self.assertIsNone(path)
 
+    def test_newest_comment_match_skips_newer_comments_without_value(self):
+        comments = [
+            {'text': 'location: /a/new.mov', 'created_at': '2024-03-01'},
+            {'text': 'no path here', 'created_at': '2024-04-01'},
+            {'text': 'location: /a/old.mov', 'created_at': '2024-01-01'},
+            {'text': 'location: /a/tie.mov', 'created_at': '2024-03-01'},
+        ]
+        text, value = kitsu_client._newest_comment_match(  # pylint: disable=protected-access
+            comments, utils.extract_location_from_comment)
+        self.assertEqual(text, 'location: /a/tie.mov')
+        self.assertEqual(value, '/a/tie.mov')
+
+    def test_shot_tasks_are_cached_between_lookups(self):
+        kitsu_client.get_latest_conform_comment('shot-1')
+        kitsu_client.get_latest_workfile_for_shot('shot-1', 'Compositing')
+        self.assertEqual(self._fake.task.task_requests, 1)
+        kitsu_client.invalidate_shot_cache('shot-1')
+        kitsu_client.get_latest_workfile_for_shot('shot-1', 'Compositing')
+        self.assertEqual(self._fake.task.task_requests, 2)
+
+    def test_get_projects_serves_disk_cache_then_refreshes(self):
+        self._fake.project.projects = [{'id': 'p1', 'name': 'Show A'}]
+        kitsu_client.get_projects()
+        self._fake.project.projects.append({'id': 'p2', 'name': 'Show B'})
+        ok, cached = kitsu_client.get_projects()
+        self.assertTrue(ok)
+        self.assertEqual([project['name'] for project in cached], ['Show A'])
+        self._wait_for_cache_refreshes()
+        ok, refreshed = kitsu_client.get_projects()
+        self.assertEqual([project['name'] for project in refreshed], ['Show A', 'Show B'])
+
+    def test_get_shots_uses_disk_cache_only_when_offline(self):
+        self._fake.shot.shots_map = {'seq-1': [{'id': 's2', 'name': 'sh020'}, {'id': 's1', 'name': 'sh010'}]}
+        ok, shots = kitsu_client.get_shots_for_sequence('seq-1')
+        self.assertEqual([shot['name'] for shot in shots], ['sh010', 'sh020'])
+        self._fake.shot.shots_map['seq-1'].append({'id': 's3', 'name': 'sh030'})
+        ok, shots = kitsu_client.get_shots_for_sequence('seq-1')
+        self.assertEqual([shot['name'] for shot in shots], ['sh010', 'sh020', 'sh030'])
+        self._fake.shot.offline = True
+        ok, cached = kitsu_client.get_shots_for_sequence('seq-1')
+        self.assertTrue(ok)
+        self.assertEqual(cached, shots)
+
+    def test_translate_repo_path_prefers_longest_mapping(self):
+        kitsu_client._CONFIG = {  # pylint: disable=protected-access
+            'path_mappings': [
+                {'match': '/mnt', 'replace': '/generic'},
+                {'match': '/mnt/showA', 'replace': '/show_a'},
+            ],
+        }
+        self.assertEqual(kitsu_client.translate_repo_path_to_unc('/mnt/showA/plate.mov'), '/show_a/plate.mov')
+        self.assertEqual(kitsu_client.translate_repo_path_to_unc('/mnt/showB/plate.mov'), '/generic/showB/plate.mov')
+        self.assertEqual(kitsu_client.translate_repo_path_to_unc('/other/plate.mov'), '/other/plate.mov')
+
+    def test_load_config_reloads_when_file_changes(self):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            with open(path, 'w') as config_file:
+                json.dump({'path_mappings': [{'match': '/old', 'replace': '/first'}]}, config_file)
+            kitsu_client._CONFIG = None  # pylint: disable=protected-access
+            kitsu_client._CONFIG_PATH = path  # pylint: disable=protected-access
+            self.assertEqual(kitsu_client.translate_repo_path_to_unc('/old/a.nk'), '/first/a.nk')
+            with open(path, 'w') as config_file:
+                json.dump({'path_mappings': [{'match': '/old', 'replace': '/second'}]}, config_file)
+            stat = os.stat(path)
+            os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+            self.assertEqual(kitsu_client.translate_repo_path_to_unc('/old/a.nk'), '/second/a.nk')
+        finally:
+            os.unlink(path)
+
+    def test_load_config_picks_up_file_created_later(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'plugin_config.json')
+        try:
+            kitsu_client._CONFIG = None  # pylint: disable=protected-access
+            kitsu_client._CONFIG_PATH = path  # pylint: disable=protected-access
+            self.assertEqual(kitsu_client.translate_repo_path_to_unc('/old/a.nk'), '/old/a.nk')
+            with open(path, 'w') as config_file:
+                json.dump({'path_mappings': [{'match': '/old', 'replace': '/new'}]}, config_file)
+            self.assertEqual(kitsu_client.translate_repo_path_to_unc('/old/a.nk'), '/new/a.nk')
+        finally:
+            shutil.rmtree(directory)
+
+    def test_bootstrap_retries_ca_bundle_until_configured(self):
+        results = [None, '/certs/ca.pem']
+        calls = []
+
+        def fake_configure(host):
+            calls.append(host)
+            return results.pop(0) if results else '/certs/ca.pem'
+
+        original_configure = kitsu_client.configure_kitsu_ca_bundle
+        original_host = kitsu_client._CA_BUNDLE_HOST  # pylint: disable=protected-access
+        kitsu_client.configure_kitsu_ca_bundle = fake_configure
+        kitsu_client._CA_BUNDLE_HOST = None  # pylint: disable=protected-access
+        try:
+            for _ in range(3):
+                kitsu_client._bootstrap('https://kitsu.example')  # pylint: disable=protected-access
+        finally:
+            kitsu_client.configure_kitsu_ca_bundle = original_configure
+            kitsu_client._CA_BUNDLE_HOST = original_host  # pylint: disable=protected-access
+        self.assertEqual(calls, ['https://kitsu.example', 'https://kitsu.example'])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for nuke_kitsu_loader.core.loader message batching."""
+
+from __future__ import absolute_import
+
+import sys
+import time
+import types
+import unittest
+
+
+def _install_qt_stub():
+    """Provide the small slice of PySide2.QtCore the loader needs outside Nuke."""
+
+    class _BoundSignal(object):
+        def __init__(self):
+            self._slots = []
+
+        def connect(self, slot, *args):
+            self._slots.append(slot)
+
+        def emit(self, *args):
+            for slot in list(self._slots):
+                slot(*args)
+
+    class _Signal(object):
+        def __init__(self, *types_):
+            pass
+
+        def __get__(self, instance, owner):
+            if instance is None:
+                return self
+            key = '_signal_%d' % id(self)
+            bound = instance.__dict__.get(key)
+            if bound is None:
+                bound = instance.__dict__[key] = _BoundSignal()
+            return bound
+
+    class _QObject(object):
+        def __init__(self, parent=None):
+            self._parent = parent
+
+        def thread(self):
+            return None
+
+    class _QThread(_QObject):
+        @staticmethod
+        def currentThread():
+            return None
+
+    class _QElapsedTimer(object):
+        def __init__(self):
+            self._started = None
+
+        def isValid(self):
+            return self._started is not None
+
+        def start(self):
+            self._started = time.time()
+
+        def elapsed(self):
+            return int((time.time() - self._started) * 1000)
+
+    qtcore = types.ModuleType('PySide2.QtCore')
+    qtcore.QObject = _QObject
+    qtcore.QThread = _QThread
+    qtcore.QElapsedTimer = _QElapsedTimer
+    qtcore.Signal = _Signal
+    qtcore.Slot = lambda *args, **kwargs: (lambda func: func)
+    qtcore.Qt = type('Qt', (), {'BlockingQueuedConnection': 3})
+    package = types.ModuleType('PySide2')
+    package.QtCore = qtcore
+    sys.modules['PySide2'] = package
+    sys.modules['PySide2.QtCore'] = qtcore
+
+
+try:  # pragma: no cover - depends on the host environment
+    from PySide2 import QtCore  # pylint: disable=import-error,unused-import
+except ImportError:  # pragma: no cover
+    _install_qt_stub()
+
+from nuke_kitsu_loader.core import loader  # noqa: E402
+
+
+class LoaderMessageBatchingTests(unittest.TestCase):
+    """Check that per-shot status lines and progress are coalesced."""
+
+    def test_plate_loop_batches_messages_and_progress(self):
+        thread = loader.LoaderThread([], 'Timeline')
+        events = []
+        thread.message.connect(lambda text: events.append(('message', text)))
+        thread.progress.connect(lambda value: events.append(('progress', value)))
+        shots = [{'id': 'id-%d' % idx, 'name': 'sh%03d' % idx} for idx in range(40)]
+
+        def fake_plate(sequence_name, shot, conform_lookup=None):
+            thread._queue_message('Imported plate for shot %s' % shot['name'])  # pylint: disable=protected-access
+            return {'entry': {'shot': shot['name'], 'clip': None}, 'warnings': []}
+
+        thread._fetch_conform_comment = lambda shot: (True, None)  # pylint: disable=protected-access
+        thread._process_shot_plate = fake_plate  # pylint: disable=protected-access
+        thread._total_shots = len(shots)  # pylint: disable=protected-access
+        plan = {'sequence': {'name': 'seq'}, 'shots': shots, 'task_names': []}
+        try:
+            thread._process_sequence_plan_for_combined_timeline(plan, [], set(), [])  # pylint: disable=protected-access
+            thread._flush_messages()  # pylint: disable=protected-access
+        finally:
+            thread._shutdown_kitsu_pool()  # pylint: disable=protected-access
+
+        messages = [payload for kind, payload in events if kind == 'message']
+        progress = [payload for kind, payload in events if kind == 'progress']
+        self.assertLess(len(messages), len(shots))
+        self.assertLess(len(progress), len(shots))
+        lines = '\n'.join(messages).split('\n')
+        self.assertEqual(lines, ['Imported plate for shot %s' % shot['name'] for shot in shots])
+        self.assertEqual(progress[-1], 100)
+        # Each progress value follows the batch of lines it reports on
+        self.assertEqual(events[0][0], 'message')
+        self.assertEqual(events[-1], ('progress', 100))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
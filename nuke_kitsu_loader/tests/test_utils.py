@@ -5,6 +5,7 @@ from __future__ import absolute_import
 
 import os
 import tempfile
+import threading
 import unittest
 
 from nuke_kitsu_loader.core import utils
@@ -57,6 +58,37 @@ class UtilsTests(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_iter_concurrently_preserves_input_order(self):
+        pool = utils.create_thread_pool(4)
+        try:
+            pairs = list(utils.iter_concurrently(pool, lambda value: value * 2, [3, 1, 2]))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.assertEqual(pairs, [(3, 6), (1, 2), (2, 4)])
+
+    def test_iter_concurrently_cancels_queued_calls_on_close(self):
+        pool = utils.create_thread_pool(1)
+        if pool is None:
+            self.skipTest('concurrent.futures is not available')
+        gate = threading.Event()
+        started = []
+
+        def work(value):
+            started.append(value)
+            if value > 1:
+                gate.wait(5)
+            return value
+
+        try:
+            lookups = utils.iter_concurrently(pool, work, [1, 2, 3])
+            self.assertEqual(next(lookups), (1, 1))
+            lookups.close()
+        finally:
+            gate.set()
+            pool.shutdown()
+        self.assertNotIn(3, started)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
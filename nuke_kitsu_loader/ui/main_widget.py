@@ -37,6 +37,7 @@ class KitsuLoaderMainWidget(QtWidgets.QWidget):
         self._sequence_scroll.setWidgetResizable(True)
         self._sequence_scroll.setWidget(self._sequence_container)
         self._loader_thread = None
+        self._finishing_threads = []  # completed loaders still writing their run summary
         self._sequence_cards = []
         self._main_thread_executor = MainThreadExecutor()
         self._current_project = None
@@ -131,6 +132,7 @@ class KitsuLoaderMainWidget(QtWidgets.QWidget):
         self._loader_thread.progress.connect(self._on_progress)
         self._loader_thread.completed.connect(self._on_completed)
         self._loader_thread.errored.connect(self._on_error)
+        self._loader_thread.summary_written.connect(self._on_summary_written)
         self._loader_thread.start()
 
     def _on_progress(self, value):
@@ -139,8 +141,22 @@ class KitsuLoaderMainWidget(QtWidgets.QWidget):
     def _on_completed(self, summary):
         self._append_log('Loader finished: %s' % summary)
         self._load_button.setEnabled(True)
+        if self._loader_thread is not None:
+            self._finishing_threads.append(self._loader_thread)
         self._loader_thread = None
 
+    def _on_summary_written(self, summary_path):
+        if summary_path:
+            self._append_log('Run summary saved to %s' % summary_path)
+        else:
+            self._append_log('Run summary could not be written; see the debug log')
+        loader_thread = self.sender()
+        if loader_thread in self._finishing_threads:
+            self._finishing_threads.remove(loader_thread)
+        elif self._finishing_threads:
+            # Summaries are written in completion order, so the oldest one is done
+            self._finishing_threads.pop(0)
+
     def _on_error(self, payload):
         self._append_log('ERROR: %s' % unicode(payload.get('message', 'Unknown error')))
 